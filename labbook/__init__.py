@@ -4,6 +4,12 @@ Labbook package for managing machine learning experiments.
 Package features the `Labbook` class for saving and loading trained machine 
 learning models. Currently supports TensorFlow and Sci-Kit Learn projects. 
 
+The `Scheduler` class trains and saves several models in parallel using a user 
+provided scheme.
+
+The `Evaluator` class gets the predictions of several saved models on HDF5 data 
+in a single pass, caching the predictions in the project.
+
 Includes a GUI and CLI interface for checking or comparing saved models.
 
 Developed by Aditya Marathe, 2024. This package is under the GNU General Public 
@@ -11,12 +17,14 @@ License version 3 - see 'LISCENSE' for details.
 
 Notes
 -----
-    Future plans: add support to PyTorch models and create a `Scheduler` for 
-    training and saving several models using a user provided scheme. 
+    Future plans: add support to PyTorch models.
 """
 
-__all__ = ['Labbook']
+__all__ = ['Labbook', 'Scheduler', 'ModelSpec', 'Evaluator']
 
 __version__ = '0.0.1'
 
 from labbook.labbook import Labbook
+from labbook.scheduler import Scheduler
+from labbook.scheduler import ModelSpec
+from labbook.evaluate import Evaluator
@@ -7,9 +7,16 @@ __all__ = []
 
 from typing import Any
 
+import pathlib
+
 import click
 
 from labbook.browser import BrowserApp
+from labbook.benchmark import SIZES
+from labbook.benchmark import run_benchmarks
+from labbook.benchmark import format_run
+from labbook.benchmark import load_last_run
+from labbook.benchmark import save_run
 
 
 @click.group(invoke_without_command=True)
@@ -23,15 +30,96 @@ def cli(context: Any) -> None:
 
 
 @click.command(name='browser')
-def browser() -> None:
+@click.option(
+    '--project-path', '-P',
+    type=click.Path(exists=True, file_okay=False),
+    help='The path to the project to open.'
+)
+def browser(project_path: str | None = None) -> None:
     """\
     Launches the Labbook GUI `Browser` app.
+
+    Parameters
+    ----------
+    project_path : str | None
+        The path to the project to open. Defaults to `None`.
     """
-    app = BrowserApp()
+    app = BrowserApp(project_path=project_path)
     app.mainloop()
 
 
+@click.command(name='benchmark')
+@click.option(
+    '--sizes', '-S',
+    default=','.join(map(str, SIZES)),
+    show_default=True,
+    help='Comma separated numbers of models in the synthetic projects.'
+)
+@click.option(
+    '--repeat', '-R',
+    default=3,
+    show_default=True,
+    help='The number of times each timing is repeated.'
+)
+@click.option(
+    '--results', '-O',
+    type=click.Path(dir_okay=False),
+    default='labbook-benchmarks.jsonl',
+    show_default=True,
+    help='File the results are appended to and compared against.'
+)
+@click.option(
+    '--work-dir',
+    type=click.Path(exists=True, file_okay=False),
+    help='The directory to create the synthetic projects in.'
+)
+@click.option(
+    '--profile-dir',
+    type=click.Path(file_okay=False),
+    help='Saves cProfile stats for opening each project to this directory.'
+)
+@click.option(
+    '--trace-memory',
+    is_flag=True,
+    help='Prints the top tracemalloc allocations when opening each project.'
+)
+@click.option(
+    '--xvfb/--no-xvfb',
+    default=True,
+    show_default=True,
+    help='Starts an Xvfb virtual display for the sidebar benchmarks if there '
+         'is no display.'
+)
+def benchmark(
+        sizes: str,
+        repeat: int,
+        results: str,
+        work_dir: str | None = None,
+        profile_dir: str | None = None,
+        trace_memory: bool = False,
+        xvfb: bool = True
+    ) -> None:
+    """\
+    Benchmarks Labbook on synthetic projects of increasing size.
+    """
+    results_path = pathlib.Path(results)
+    previous = load_last_run(results_path=results_path)
+
+    run = run_benchmarks(
+        sizes=tuple(int(size) for size in sizes.split(',')),
+        repeat=repeat,
+        work_dir=work_dir,
+        profile_dir=profile_dir,
+        trace_memory=trace_memory,
+        use_xvfb=xvfb
+    )
+    save_run(results_path=results_path, run=run)
+
+    click.echo(format_run(run=run, previous=previous))
+
+
 cli.add_command(browser)
+cli.add_command(benchmark)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,565 @@
+"""\
+Module contains benchmarks for `Labbook` projects of increasing size. Try
+`labbook benchmark --help` for more information.
+
+Notes
+-----
+    The browser sidebar benchmarks need a display. On Linux machines without 
+    one (e.g. analysis nodes), a virtual display is started automatically if 
+    `Xvfb` is installed (e.g. `apt install xvfb`); otherwise the sidebar 
+    metrics are skipped.
+"""
+__all__ = ['run_benchmarks', 'load_last_run', 'save_run', 'format_run']
+
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import pathlib
+import cProfile
+import tempfile
+import contextlib
+import subprocess
+import tracemalloc
+from types import SimpleNamespace
+from datetime import datetime
+
+import tkinter as tk
+
+import numpy as np
+import joblib
+
+from labbook import __version__
+from labbook.browser import _SearchIndex
+from labbook.browser import _VirtualList
+from labbook.labbook import DATE_FMT
+from labbook.labbook import SNAPSHOT_FILE
+from labbook.labbook import Labbook
+
+SIZES = 100, 1_000, 10_000, 100_000
+N_ARTIFACTS = 50  # Models share these artifacts, so disk use stays bounded
+ARTIFACT_SIZE = 262_144  # bytes
+N_QUERIES = 1_000
+N_APPENDS = 200
+SEARCH_QUERIES = 'model-01', 'sweep', 'mlp 12', 'rec.var3', 'no-match'
+SIDEBAR_SIZE = 400, 800  # px
+
+TAGS = 'baseline', 'sweep', 'mlp', 'bdt', 'cnn', 'numu', 'nue'
+
+
+def _make_project(
+        project_path: pathlib.Path,
+        n_models: int,
+        n_artifacts: int = N_ARTIFACTS,
+        artifact_size: int = ARTIFACT_SIZE,
+        seed: int = 0
+    ) -> float:
+    """\
+    Creates a synthetic project.
+
+    Parameters
+    ----------
+    project_path : pathlib.Path
+        The (empty) directory to create the project in.
+
+    n_models : int
+        The number of models.
+
+    n_artifacts : int
+        The number of saved model files shared by the models. Defaults to
+        `N_ARTIFACTS`.
+
+    artifact_size : int
+        The size of each saved model in bytes. Defaults to `ARTIFACT_SIZE`.
+
+    seed : int
+        The random seed. Defaults to 0.
+
+    Returns
+    -------
+    float
+        The time taken to save the artifacts in seconds.
+    """
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+
+    models_dir = project_path / 'models'
+    models_dir.mkdir(parents=True)
+
+    start = time.perf_counter()
+
+    for i in range(n_artifacts):
+        joblib.dump(
+            {'Weights': np_rng.standard_normal(artifact_size // 8)},
+            models_dir / f'artifact-{i}.joblib'
+        )
+
+    save_time = time.perf_counter() - start
+
+    variables = [f'rec.var{j}' for j in range(40)]
+    time_str = datetime(2024, 1, 1).strftime(DATE_FMT)
+
+    models = [
+        {
+            'Name': f'Model-{i:06d}',
+            'Time': time_str,
+            'Comments': f'Synthetic model {i}.',
+            'TrainedOn': [f'dataset-{rng.randrange(10)}.h5'],
+            'XVars': rng.sample(variables, k=rng.randint(5, 20)),
+            'YVars': ['rec.energy'],
+            'Transforms': ['Standardise'],
+            'Pickled': {
+                'Model': f'models/artifact-{i % n_artifacts}.joblib',
+                'Params': {'lr': rng.choice([1e-2, 1e-3]), 'layers': i % 8}
+            },
+            'Flagged': not i % 50,
+            'Tags': rng.sample(TAGS, k=2)
+        }
+        for i in range(n_models)
+    ]
+
+    with open(file=project_path / SNAPSHOT_FILE, mode='w') as file:
+        json.dump(
+            {
+                'Name': f'Benchmark-{n_models}',
+                'Comments': {},
+                'Models': models
+            },
+            file
+        )
+
+    return save_time
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    """\
+    Times a function.
+
+    Parameters
+    ----------
+    func : Callable[[], Any]
+        The function to time.
+
+    repeat : int
+        The number of times to run the function.
+
+    Returns
+    -------
+    float
+        The fastest run time in seconds.
+    """
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def _peak_memory(func: Callable[[], Any]) -> tuple[float, Any]:
+    """\
+    Measures the peak memory allocated by a function using `tracemalloc`.
+
+    Returns
+    -------
+    tuple[float, Any]
+        The peak memory in MiB and the final `tracemalloc` snapshot.
+    """
+    tracemalloc.start()
+
+    try:
+        result = func()  # Kept alive so the snapshot shows what it holds
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return peak / 1_048_576, snapshot
+
+
+@contextlib.contextmanager
+def _virtual_display(use_xvfb: bool = True) -> Iterator[None]:
+    """\
+    Starts an `Xvfb` virtual display for the duration of the context if there 
+    is no display.
+
+    Parameters
+    ----------
+    use_xvfb : bool
+        Whether a virtual display may be started. Defaults to `True`.
+
+    Notes
+    -----
+        Nothing is done on platforms other than Linux, if a display is already
+        set, or if `Xvfb` is not installed.
+    """
+    xvfb = shutil.which('Xvfb')
+
+    if (
+            not use_xvfb or xvfb is None or os.environ.get('DISPLAY')
+            or not sys.platform.startswith('linux')
+        ):
+        yield
+        return
+
+    # Xvfb picks a free display number and writes it to `write_fd`
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen(
+        [
+            xvfb, '-displayfd', str(write_fd), '-nolisten', 'tcp',
+            '-screen', '0', f'{SIDEBAR_SIZE[0]}x{SIDEBAR_SIZE[1]}x24'
+        ],
+        pass_fds=(write_fd,),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    os.close(write_fd)
+
+    with os.fdopen(read_fd, mode='r') as pipe:
+        display = pipe.readline().strip()
+
+    try:
+        if display:
+            os.environ['DISPLAY'] = f':{display}'
+
+        yield
+    finally:
+        os.environ.pop('DISPLAY', None)
+
+        process.terminate()
+        process.wait()
+
+
+def _bench_sidebar(items: list[dict[str, Any]]) -> dict[str, float] | None:
+    """\
+    Times building and scrolling the browser sidebar in a hidden window.
+
+    Returns
+    -------
+    dict[str, float] | None
+        The timings in seconds, or `None` if there is no display.
+
+    Raises
+    ------
+    RuntimeError
+        If the sidebar did not create any rows.
+    """
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+
+    try:
+        root.withdraw()
+        root.geometry(f'{SIDEBAR_SIZE[0]}x{SIDEBAR_SIZE[1]}')
+
+        start = time.perf_counter()
+
+        sidebar = _VirtualList(root)
+        sidebar.pack(fill=tk.BOTH, expand=True)
+        sidebar.set_items(items)
+        _SearchIndex(items=items)
+
+        # Rows are created on `<Configure>`, which is not sent to the hidden 
+        # window, so the resize is done explicitly
+        root.update_idletasks()
+        sidebar._on_resize(SimpleNamespace(height=SIDEBAR_SIZE[1]))
+        root.update_idletasks()
+
+        build_time = time.perf_counter() - start
+
+        if not sidebar._rows or (items and sidebar._rows[0].index != 0):
+            raise RuntimeError('The sidebar did not build any rows.')
+
+        positions = range(0, len(items), max(len(items) // 100, 1))
+        start = time.perf_counter()
+
+        for i in positions:
+            sidebar.scroll_to(i)
+            root.update_idletasks()
+
+        scroll_time = (time.perf_counter() - start) / max(len(positions), 1)
+    finally:
+        root.destroy()
+
+    return {'Sidebar Build (s)': build_time, 'Sidebar Scroll (s)': scroll_time}
+
+
+def _bench_size(
+        project_path: pathlib.Path,
+        n_models: int,
+        repeat: int,
+        profile_dir: pathlib.Path | None,
+        trace_memory: bool
+    ) -> tuple[dict[str, float | None], list[str]]:
+    """\
+    Runs the benchmarks for a single project size.
+
+    Returns
+    -------
+    tuple[dict[str, float | None], list[str]]
+        Maps the metric names to their values, and the top allocations when 
+        opening the project (empty unless `trace_memory` is set).
+    """
+    results: dict[str, float | None] = {}
+
+    save_time = _make_project(project_path=project_path, n_models=n_models)
+    results['Artifact Save (MB/s)'] = (
+        N_ARTIFACTS * ARTIFACT_SIZE / 1e6 / save_time
+    )
+
+    # Open
+    results['Open (s)'] = _best_time(lambda: Labbook(project_path), repeat)
+
+    peak, snapshot = _peak_memory(lambda: Labbook(project_path))
+    results['Open Peak Memory (MiB)'] = peak
+
+    allocations = []
+
+    if trace_memory:
+        allocations = [str(stat) for stat in snapshot.statistics('lineno')[:10]]
+
+    if profile_dir is not None:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+        profiler = cProfile.Profile()
+        profiler.runcall(Labbook, project_path)
+        profiler.dump_stats(profile_dir / f'open-{n_models}.prof')
+
+    labbook = Labbook(project_path)
+
+    # Queries
+    names = [model.Name for model in labbook.models]
+    sample = random.Random(0).choices(names, k=N_QUERIES)
+
+    results['Get Model (us)'] = 1e6 * _best_time(
+        lambda: [labbook.get_model(name) for name in sample], repeat
+    ) / N_QUERIES
+
+    items = [
+        {'Name': model.Name, 'Tags': model.Tags} for model in labbook.models
+    ]
+
+    start = time.perf_counter()
+    search_index = _SearchIndex(items=items)
+    results['Search Index Build (s)'] = time.perf_counter() - start
+
+    results['Search (ms)'] = 1e3 * _best_time(
+        lambda: [search_index.search(query) for query in SEARCH_QUERIES],
+        repeat
+    ) / len(SEARCH_QUERIES)
+
+    # Save / load
+    start = time.perf_counter()
+
+    for i in range(N_APPENDS):
+        labbook.add_model(
+            name=f'Appended-{i}',
+            trained_on=['dataset-0.h5'],
+            x_vars=['rec.var0'],
+            y_vars=['rec.energy'],
+            transforms=[],
+            pickled={'Model': 'models/artifact-0.joblib'}
+        )
+
+    results['Add Model (ms)'] = 1e3 * (time.perf_counter() - start) / N_APPENDS
+    results['Open With Journal (s)'] = _best_time(
+        lambda: Labbook(project_path), repeat
+    )
+
+    start = time.perf_counter()
+    labbook.compact()
+    results['Compact (s)'] = time.perf_counter() - start
+
+    artifacts = sorted((project_path / 'models').glob('*.joblib'))
+
+    results['Artifact Load (MB/s)'] = (
+        len(artifacts) * ARTIFACT_SIZE / 1e6 /
+        _best_time(lambda: [joblib.load(path) for path in artifacts], repeat)
+    )
+
+    # Browser
+    sidebar_results = _bench_sidebar(items=items)
+
+    if sidebar_results is None:
+        results.update({'Sidebar Build (s)': None, 'Sidebar Scroll (s)': None})
+    else:
+        results.update(sidebar_results)
+
+    return results, allocations
+
+
+def run_benchmarks(
+        sizes: tuple[int, ...] = SIZES,
+        repeat: int = 3,
+        work_dir: str | pathlib.Path | None = None,
+        profile_dir: str | pathlib.Path | None = None,
+        trace_memory: bool = False,
+        use_xvfb: bool = True
+    ) -> dict[str, Any]:
+    """\
+    Benchmarks `Labbook` on synthetic projects of increasing size.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...]
+        The number of models in each project. Defaults to `SIZES`.
+
+    repeat : int
+        The number of times each timing is repeated (the fastest is kept).
+        Defaults to 3.
+
+    work_dir : str | pathlib.Path | None
+        The directory to create the projects in. Defaults to a temporary
+        directory which is deleted afterwards.
+
+    profile_dir : str | pathlib.Path | None
+        Saves `cProfile` stats for opening each project to this directory.
+        Defaults to no profiling.
+
+    trace_memory : bool
+        Records the top `tracemalloc` allocations when opening each project 
+        under 'Allocations'. Defaults to `False`.
+
+    use_xvfb : bool
+        Starts an `Xvfb` virtual display for the sidebar benchmarks if there 
+        is no display. Defaults to `True`.
+
+    Returns
+    -------
+    dict[str, Any]
+        The benchmark results.
+    """
+    if profile_dir is not None:
+        profile_dir = pathlib.Path(profile_dir)
+
+    run = {
+        'Time': datetime.now().isoformat(timespec='seconds'),
+        'Version': __version__,
+        'Results': {}
+    }
+
+    with tempfile.TemporaryDirectory(dir=work_dir) as temp_dir, \
+            _virtual_display(use_xvfb=use_xvfb):
+        for n_models in sizes:
+            results, allocations = _bench_size(
+                project_path=pathlib.Path(temp_dir) / f'project-{n_models}',
+                n_models=n_models,
+                repeat=repeat,
+                profile_dir=profile_dir,
+                trace_memory=trace_memory
+            )
+            run['Results'][str(n_models)] = results
+
+            if trace_memory:
+                run.setdefault('Allocations', {})[str(n_models)] = allocations
+
+    return run
+
+
+def load_last_run(results_path: pathlib.Path) -> dict[str, Any] | None:
+    """\
+    Reads the last saved benchmark run.
+
+    Parameters
+    ----------
+    results_path : pathlib.Path
+        The path to the results file.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The last run, or `None` if there are no saved runs.
+    """
+    if not results_path.is_file():
+        return None
+
+    with open(file=results_path, mode='r') as file:
+        lines = [line for line in file if line.strip()]
+
+    return json.loads(lines[-1]) if lines else None
+
+
+def save_run(results_path: pathlib.Path, run: dict[str, Any]) -> None:
+    """\
+    Appends a benchmark run to the results file (one JSON object per line).
+
+    Parameters
+    ----------
+    results_path : pathlib.Path
+        The path to the results file.
+
+    run : dict[str, Any]
+        The benchmark run returned by `run_benchmarks`.
+    """
+    with open(file=results_path, mode='a') as file:
+        file.write(json.dumps(run) + '\n')
+
+
+def format_run(
+        run: dict[str, Any],
+        previous: dict[str, Any] | None = None
+    ) -> str:
+    """\
+    Formats a benchmark run as a table, with the change since the previous
+    run if given.
+
+    Parameters
+    ----------
+    run : dict[str, Any]
+        The benchmark run returned by `run_benchmarks`.
+
+    previous : dict[str, Any] | None
+        The run to compare against. Defaults to `None`.
+
+    Returns
+    -------
+    str
+        The formatted table.
+    """
+    lines = []
+
+    for size, allocations in run.get('Allocations', {}).items():
+        lines.append(f'\nTop allocations when opening {int(size):,} models:')
+        lines.extend(f'    {allocation}' for allocation in allocations)
+
+    for size, results in run['Results'].items():
+        lines.append(f'\n{int(size):,} models')
+
+        old_results = (previous or {}).get('Results', {}).get(size, {})
+
+        for metric, value in results.items():
+            if value is None:
+                lines.append(f'    {metric:<26}{"-":>12}')
+                continue
+
+            line = f'    {metric:<26}{value:>12.4g}'
+            old_value = old_results.get(metric)
+
+            if old_value:
+                line += f'    ({(value - old_value) / old_value:+.1%})'
+
+            lines.append(line)
+
+    skipped = any(
+        results.get('Sidebar Build (s)', 0.) is None
+        for results in run['Results'].values()
+    )
+
+    if skipped:
+        lines.append(
+            '\nSidebar metrics were skipped as there is no display - install '
+            'Xvfb to run them headless.'
+        )
+
+    return '\n'.join(lines)
@@ -5,12 +5,25 @@ A GUI for browsing the digital labbook - an alternative to the CLI.
 __all__ = ['BrowserApp']
 
 from typing import Any
+from typing import Callable
+from typing import Iterable
 # from typing import override  # NOTE Only in Python 3.12.x!
 
+import re
+import bisect
+import pathlib
+
 import tkinter as tk
+from tkinter import filedialog
+from tkinter import messagebox
 from tkinter import ttk
 
+from labbook.labbook import Labbook
+from labbook.tasks import _TaskContext
+from labbook.tasks import _TaskRunner
+
 WINDOW_SIZE = 1_200, 550
+LIST_WIDTH = 350
 
 colours = {
     'White': '#ffffff',
@@ -22,9 +35,113 @@ colours = {
 fonts = {
     'Title': ('CMU Concrete', 12, 'bold'),
     'Text': ('CMU Sans Serif', 10),
+    'Bold Text': ('CMU Sans Serif', 10, 'bold'),
     'Symbol': ('Wingdings', 10)
 }
 
+# Model fields shown when comparing models
+COMPARE_FIELDS = (
+    'Time', 'TrainedOn', 'XVars', 'YVars', 'Transforms', 'Tags', 'Flagged'
+)
+
+
+def _load_project(
+        task: _TaskContext,
+        project_path: pathlib.Path
+    ) -> tuple[Labbook, list[dict[str, Any]], '_SearchIndex']:
+    """\
+    Opens a project and prepares the sidebar contents - runs in the 
+    background.
+
+    Args
+    ----
+    task: _TaskContext
+        Used to report progress.
+
+    project_path: pathlib.Path
+        The path to the project.
+
+    Returns
+    -------
+    tuple[Labbook, list[dict[str, Any]], _SearchIndex]
+        The project, the sidebar items, and the sidebar search index.
+    """
+    task.progress(None, 'Opening project...')
+
+    labbook = Labbook(project_path=project_path)
+    models = labbook.models
+
+    items = []
+
+    for i, model in enumerate(models):
+        if not i % 1_000:
+            task.progress(i / len(models), 'Reading models...')
+
+        items.append({'Name': model.Name, 'Tags': model.Tags})
+
+    task.progress(None, 'Building search index...')
+
+    return labbook, items, _SearchIndex(items=items)
+
+
+def _compare_models(
+        task: _TaskContext,
+        labbook: Labbook,
+        names: list[str]
+    ) -> tuple[list[str], dict[str, list[str]]]:
+    """\
+    Tabulates the details of several models, including the paths and sizes of
+    their saved artifacts - runs in the background.
+
+    Args
+    ----
+    task: _TaskContext
+        Used to report progress.
+
+    labbook: Labbook
+        The project the models are saved in.
+
+    names: list[str]
+        The names of the models to compare.
+
+    Returns
+    -------
+    tuple[list[str], dict[str, list[str]]]
+        The model names, and the value of each row for every model.
+    """
+    table: dict[str, list[str]] = {field: [] for field in COMPARE_FIELDS}
+
+    for i, name in enumerate(names):
+        task.progress(i / len(names), f'Reading \'{name}\'...')
+
+        model = labbook.get_model(name)
+        details = model.model_dump(mode='json')
+
+        for field in COMPARE_FIELDS:
+            value = details[field]
+            table[field].append(
+                ', '.join(map(str, value)) if isinstance(value, list)
+                else str(value)
+            )
+
+        # Artifacts are not unpickled, as only their size is shown
+        for key, value in model.Pickled.items():
+            row = table.setdefault(key, [''] * i)
+            artifact_path = labbook.project_path / str(value)
+
+            if isinstance(value, str) and artifact_path.is_file():
+                size = artifact_path.stat().st_size / 1_048_576
+                row.append(f'{value} ({size:0.2f} MiB)')
+            else:
+                row.append(str(value))
+
+        for row in table.values():  # Pads rows missing for this model
+            row.extend([''] * (i + 1 - len(row)))
+
+    task.progress(1., 'Done.')
+
+    return names, table
+
 
 class _AutoHideScrollbar(ttk.Scrollbar):
     """\
@@ -164,17 +281,211 @@ class _ScrollableFrame(tk.Frame):
         )
 
 
+class _Selection:
+    """\
+    [Internal] Keeps track of the selected items in a list - independent of
+    the Tkinter variables, so the number of selected items is always known 
+    without counting.
+    """
+    def __init__(self, n_items: int = 0) -> None:
+        """\
+        Initialises Selection.
+
+        Args
+        ----
+        n_items: int
+            The number of items in the list.
+        """
+        self.reset(n_items=n_items)
+
+    def reset(self, n_items: int) -> None:
+        """\
+        Clears the selection for a list with `n_items` items.
+        """
+        self._selected = [False] * n_items
+        self.count = 0
+
+    def __len__(self) -> int:
+        return len(self._selected)
+
+    def __getitem__(self, index: int) -> bool:
+        return self._selected[index]
+
+    def set(self, index: int, state: bool) -> None:
+        """\
+        Selects or deselects an item.
+        """
+        state = bool(state)
+
+        if self._selected[index] != state:
+            self._selected[index] = state
+            self.count += 1 if state else -1
+
+    def select(self, indices: Iterable[int] | None = None) -> None:
+        """\
+        Selects the items at `indices` (or all items).
+        """
+        if indices is None:
+            self._selected = [True] * len(self._selected)
+            self.count = len(self._selected)
+            return
+
+        for index in indices:
+            self.set(index, True)
+
+    def deselect(self, indices: Iterable[int] | None = None) -> None:
+        """\
+        Deselects the items at `indices` (or all items).
+        """
+        if indices is None:
+            self.reset(n_items=len(self._selected))
+            return
+
+        for index in indices:
+            self.set(index, False)
+
+    def invert(self, indices: Iterable[int] | None = None) -> None:
+        """\
+        Inverts the selection of the items at `indices` (or all items).
+        """
+        if indices is None:
+            self._selected = [not state for state in self._selected]
+            self.count = len(self._selected) - self.count
+            return
+
+        for index in indices:
+            self.set(index, not self._selected[index])
+
+    def selected(self) -> list[int]:
+        """\
+        Returns the indices of the selected items.
+        """
+        return [i for i, state in enumerate(self._selected) if state]
+
+
+class _SearchIndex:
+    """\
+    [Internal] Inverted index over the names and tags of the list items.
+
+    Each item is split into lower case words (e.g. 'MLP-v2_tuned' gives 'mlp', 
+    'v2', and 'tuned' as well as the full name). A query matches the items 
+    where every word in the query is the start of one of the item words.
+    """
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        """\
+        Builds the index.
+
+        Args
+        ----
+        items: list[dict[str, Any]]
+            The details of each item.
+        """
+        self.n_items = len(items)
+        self._postings: dict[str, set[int]] = {}
+
+        for i, details in enumerate(items):
+            for word in self._item_words(details):
+                self._postings.setdefault(word, set()).add(i)
+
+        self._words = sorted(self._postings.keys())
+
+    @staticmethod
+    def _split(text: str) -> list[str]:
+        """\
+        Splits text into lower case words.
+        """
+        return [word for word in re.split(r'[^a-z0-9.]+', text.lower()) if word]
+
+    @classmethod
+    def _item_words(cls, details: dict[str, Any]) -> set[str]:
+        """\
+        Gets the words used to find an item.
+        """
+        texts = [details.get('Name', '')] + list(details.get('Tags', []))
+        words = {text.lower() for text in texts if text}
+
+        for text in texts:
+            words.update(cls._split(text))
+
+        return words
+
+    def _prefix_matches(self, prefix: str) -> set[int]:
+        """\
+        Gets the items with a word starting with `prefix`.
+        """
+        matches = set()
+
+        start = bisect.bisect_left(self._words, prefix)
+
+        for word in self._words[start:]:
+            if not word.startswith(prefix):
+                break
+
+            matches.update(self._postings[word])
+
+        return matches
+
+    def search(self, query: str) -> list[int]:
+        """\
+        Finds the items which match a query.
+
+        Args
+        ----
+        query: str
+            The search query - an empty query matches all items.
+
+        Returns
+        -------
+        list[int]
+            The indices of the matching items in order.
+        """
+        terms = self._split(query)
+
+        if not terms:
+            return list(range(self.n_items))
+
+        matches = None
+
+        for term in sorted(terms, key=len, reverse=True):  # Longest first...
+            term_matches = self._prefix_matches(term)
+            matches = (
+                term_matches if matches is None else matches & term_matches
+            )
+
+            if not matches:
+                return []
+
+        return sorted(matches)
+
+
 class _ListItem(tk.Frame):
     """\
-    [Internal] List items in the sidebar.
+    [Internal] List items in the sidebar - re-used for different models as the
+    list is scrolled.
     """
-    def __init__(self, *args, details: dict[str, Any], **kwargs) -> None:
+    def __init__(
+            self,
+            *args,
+            on_toggle: Callable[[int, bool], None],
+            **kwargs
+        ) -> None:
         """\
         Creates a list item.
+
+        Args
+        ----
+        on_toggle: Callable[[int, bool], None]
+            Called with the index of the bound model and the new checkbox 
+            state when the checkbox is clicked.
+
+        *args, **kwargs
+            Arguments for `tk.Frame`.
         """
         super().__init__(*args, **kwargs)
 
-        self.details = details
+        self.index = -1
+        self.details: dict[str, Any] = {}
+        self._on_toggle = on_toggle
 
         self.columnconfigure(0, weight=0)
         self.columnconfigure(1, weight=1)
@@ -185,7 +496,8 @@ class _ListItem(tk.Frame):
         ttk.Checkbutton(
             self,
             variable=self.cb_state,
-            takefocus=False
+            takefocus=False,
+            command=lambda: self._on_toggle(self.index, self.cb_state.get())
         ).grid(row=0, column=0, padx=(5, 0), sticky=tk.W)
 
         bttn_kwargs = {
@@ -195,13 +507,14 @@ class _ListItem(tk.Frame):
             'hover_fg': colours['White']
         }
 
-        _CustomButton(
+        self.name_bttn = _CustomButton(
             self,
-            text=details.get('Name', '[No Name]'),
+            text='',
             anchor=tk.W,
             font=fonts['Text'],
             **bttn_kwargs
-        ).grid(row=0, column=1, sticky=tk.NSEW)
+        )
+        self.name_bttn.grid(row=0, column=1, sticky=tk.NSEW)
         _CustomButton(
             self,
             text='P',
@@ -209,17 +522,274 @@ class _ListItem(tk.Frame):
             **bttn_kwargs
         ).grid(row=0, column=2, sticky=tk.NSEW)
 
+    def bind_item(
+            self,
+            index: int,
+            details: dict[str, Any],
+            selected: bool
+        ) -> None:
+        """\
+        Binds the list item to a model.
+
+        Args
+        ----
+        index: int
+            The index of the model in the list.
+
+        details: dict[str, Any]
+            The model details.
+
+        selected: bool
+            Whether the model is selected.
+        """
+        self.index = index
+        self.details = details
+
+        self.name_bttn['text'] = details.get('Name', '[No Name]')
+        self.cb_state.set(selected)
+
+
+class _VirtualList(tk.Frame):
+    """\
+    [Internal] Scrollable list which only creates widgets for the visible rows 
+    and re-binds them to the list data when scrolled.
+    """
+    def __init__(
+            self,
+            *args,
+            item_kwargs: dict[str, Any] | None = None,
+            on_toggle: Callable[[int, bool], None] | None = None,
+            **kwargs
+        ) -> None:
+        """\
+        Initialises VirtualList.
+
+        Args
+        ----
+        item_kwargs: dict[str, Any] | None
+            Arguments for each `_ListItem`.
+
+        on_toggle: Callable[[int, bool], None] | None
+            Called with the item index and the new state when an item is 
+            (de)selected.
+
+        *args, **kwargs
+            Arguments for `tk.Frame`.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.items: list[dict[str, Any]] = []
+        self.view: list[int] = []  # Indices of the items shown in the list
+        self.selection = _Selection()
+
+        self._item_kwargs = item_kwargs or {}
+        self._on_toggle = on_toggle or (lambda *_: None)
+
+        self._top = 0  # Index of the first visible item
+        self._rows: list[_ListItem] = []
+        self._row_height = 0
+        self._n_visible = 0
+
+        # Mouse wheel bindings for the list and all row widgets
+        self._scroll_tag = f'VirtualList{id(self)}'
+        self.bind_class(self._scroll_tag, '<MouseWheel>', self._on_wheel)
+        self.bind_class(self._scroll_tag, '<Button-4>', self._on_wheel)
+        self.bind_class(self._scroll_tag, '<Button-5>', self._on_wheel)
+
+        # Scrollbar
+        self._scrollbar = _AutoHideScrollbar(
+            self,
+            orient=tk.VERTICAL,
+            command=self._on_scroll
+        )
+
+        # Container
+        self._container = tk.Frame(
+            self,
+            bg=kwargs.get('bg', None) or kwargs.get('background', None),
+            bd=0,
+            highlightthickness=0,
+            width=LIST_WIDTH
+        )
+        self._container.pack_propagate(False)  # Rows must not resize the list
+        self._container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._add_scroll_tag(self._container)
+
+        self._container.bind('<Configure>', self._on_resize)
+
+    def _add_scroll_tag(self, widget: tk.Misc) -> None:
+        """\
+        Adds the mouse wheel bindings to a widget and its children.
+        """
+        widget.bindtags((self._scroll_tag,) + widget.bindtags())
+
+        for child in widget.winfo_children():
+            self._add_scroll_tag(child)
+
+    def _on_toggle_item(self, index: int, state: bool) -> None:
+        """\
+        Records the new state of an item when its checkbox is clicked.
+        """
+        if 0 <= index < len(self.items):
+            self.selection.set(index, state)
+            self._on_toggle(index, bool(state))
+
+    def _new_row(self) -> _ListItem:
+        """\
+        Creates a new (unbound) row.
+        """
+        row = _ListItem(
+            self._container,
+            on_toggle=self._on_toggle_item,
+            **self._item_kwargs
+        )
+        self._add_scroll_tag(row)
+        self._rows.append(row)
+
+        return row
+
+    def _on_resize(self, event: tk.Event) -> None:
+        """\
+        Creates enough rows to fill the visible height of the list.
+        """
+        if not self._rows:
+            self._new_row()
+
+        if not self._row_height:
+            self._rows[0].update_idletasks()
+            self._row_height = max(self._rows[0].winfo_reqheight(), 1)
+
+        # Extra row covers a partially visible row at the bottom
+        self._n_visible = event.height // self._row_height + 1
+
+        while len(self._rows) < self._n_visible:
+            self._new_row()
+
+        self.refresh()
+
+    def _on_wheel(self, event: tk.Event) -> str:
+        """\
+        Scrolls the list when the mouse wheel is used.
+        """
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self._top - 3)
+        else:
+            self.scroll_to(self._top + 3)
+
+        return 'break'
+
+    def _on_scroll(self, action: str, value: str, unit: str = '') -> None:
+        """\
+        Scrolls the list when the scrollbar is used (`yview` protocol).
+        """
+        if action == tk.MOVETO:
+            self.scroll_to(round(float(value) * len(self.view)))
+        elif unit == tk.PAGES:
+            self.scroll_to(self._top + int(value) * (self._n_visible - 1))
+        else:
+            self.scroll_to(self._top + int(value))
+
+    def _clamp_top(self, index: int) -> int:
+        """\
+        Clamps the index of the first visible item so the list is not 
+        scrolled past either end.
+        """
+        max_top = max(len(self.view) - self._n_visible + 1, 0)
+
+        return min(max(index, 0), max_top)
+
+    def scroll_to(self, index: int) -> None:
+        """\
+        Scrolls the list so that the item at `index` is at the top.
+        """
+        top = self._clamp_top(index)
+
+        if top != self._top:
+            self._top = top
+            self.refresh()
+
+    def set_items(self, items: list[dict[str, Any]]) -> None:
+        """\
+        Replaces the items in the list and clears the selection.
+
+        Args
+        ----
+        items: list[dict[str, Any]]
+            The model details for each item.
+        """
+        self.items = items
+        self.view = list(range(len(items)))
+        self.selection.reset(n_items=len(items))
+        self._top = 0
+
+        self.refresh()
+
+    def set_view(self, view: list[int]) -> None:
+        """\
+        Sets which items are shown in the list, e.g. after filtering.
+
+        Args
+        ----
+        view: list[int]
+            The indices of the items to show, in order.
+        """
+        self.view = view
+        self._top = 0
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        """\
+        Re-binds the visible rows to the list data.
+        """
+        self._top = self._clamp_top(self._top)
+        n_shown = min(self._n_visible, len(self.view) - self._top)
+
+        for i, row in enumerate(self._rows):
+            if i < n_shown:
+                index = self.view[self._top + i]
+                row.bind_item(index, self.items[index], self.selection[index])
+                row.pack(fill=tk.X)
+            else:
+                row.pack_forget()
+
+        if self.view and self._n_visible:
+            self._scrollbar.set(
+                self._top / len(self.view),
+                (self._top + self._n_visible - 1) / len(self.view)
+            )
+        else:
+            self._scrollbar.set(0., 1.)
+
 
 class BrowserApp(tk.Tk):
     """\
     Labbook Browser - a GUI application to view trained models.
+
+    Notes
+    -----
+        Projects are opened and compared in the background, so the window 
+        stays responsive while large projects are loaded.
     """
-    def __init__(self) -> None:
+    def __init__(self, project_path: str | None = None) -> None:
         """\
         Initialises Browser.
+
+        Args
+        ----
+        project_path: str | None
+            The path to a project to open on launch. Defaults to `None`.
         """
         super().__init__()
 
+        self.labbook: Labbook | None = None
+
+        self.tasks = _TaskRunner(self)
+        self._load_task: _TaskContext | None = None
+        self._compare_task: _TaskContext | None = None
+
+        self.protocol('WM_DELETE_WINDOW', self._on_exit)
+
         self.title('Labbook')
 
         x_pos = int(0.5 * (self.winfo_screenwidth() - WINDOW_SIZE[0]))
@@ -242,14 +812,52 @@ class BrowserApp(tk.Tk):
         file_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.menu_bar.add_cascade(label='Project', menu=file_menu)
         file_menu.add_command(label='Create')
-        file_menu.add_command(label='Open')
+        file_menu.add_command(label='Open', command=self._on_open)
         file_menu.add_separator()
-        file_menu.add_command(label='Close')
+        file_menu.add_command(label='Close', command=self._on_close)
 
         # ------------------
         #   Window content
         # ------------------
 
+        # Status bar
+        status_bar = tk.Frame(self, bg=colours['White'])
+        status_bar.pack(padx=10, pady=(0, 5), side=tk.BOTTOM, fill=tk.X)
+
+        status_bar.columnconfigure(0, weight=1)
+        status_bar.columnconfigure(1, weight=0)
+        status_bar.columnconfigure(2, weight=0)
+
+        self.status_text = tk.StringVar(self, value='No project open.')
+
+        tk.Label(
+            status_bar,
+            textvariable=self.status_text,
+            font=fonts['Text'],
+            bg=colours['White']
+        ).grid(row=0, column=0, sticky=tk.W)
+
+        self.status_progress = ttk.Progressbar(
+            status_bar,
+            orient=tk.HORIZONTAL,
+            length=200,
+            maximum=1.
+        )
+        self.status_progress.grid(row=0, column=1, padx=2)
+
+        self.status_cancel_bttn = _CustomButton(
+            status_bar,
+            text='Cancel',
+            font=fonts['Text'],
+            bg=colours['Grey'],
+            hover_bg=colours['Blue'],
+            hover_fg=colours['White'],
+            relief=tk.FLAT,
+            command=self._on_cancel,
+            state=tk.DISABLED
+        )
+        self.status_cancel_bttn.grid(row=0, column=2, padx=(2, 0))
+
         self.paned_window = tk.PanedWindow(
             self,
             orient=tk.HORIZONTAL,
@@ -276,13 +884,57 @@ class BrowserApp(tk.Tk):
         #     orient=tk.HORIZONTAL
         # ).pack(padx=50, pady=10, fill=tk.X)
 
-        # Sidebar - List
-        scrollable_frame = _ScrollableFrame(self.sidebar, bg=colours['Grey'])
-        scrollable_frame.pack(padx=10, pady=(0, 10), fill=tk.BOTH, expand=True)
+        # Sidebar - Search
+        search_container = tk.Frame(self.sidebar, bg=colours['White'])
+        search_container.pack(padx=10, pady=(10, 5), fill=tk.X)
+
+        search_container.columnconfigure(0, weight=1)
+        search_container.columnconfigure(1, weight=0)
+        search_container.columnconfigure(2, weight=0)
+        search_container.columnconfigure(3, weight=0)
+
+        self.sb_search_query = tk.StringVar(self, value='')
+        self.sb_search_query.trace_add(mode='write', callback=self._sb_filter)
+
+        ttk.Entry(
+            search_container,
+            textvariable=self.sb_search_query,
+            font=fonts['Text']
+        ).grid(row=0, column=0, padx=(0, 2), sticky=tk.NSEW)
+
+        bulk_bttn_kwargs = {
+            'font': fonts['Text'],
+            'bg': colours['Grey'],
+            'hover_bg': colours['Blue'],
+            'hover_fg': colours['White'],
+            'relief': tk.FLAT
+        }
+
+        for i, (text, command) in enumerate((
+                ('All', self._sb_select_all),
+                ('None', self._sb_deselect_all),
+                ('Invert', self._sb_invert)
+            )):
+            _CustomButton(
+                search_container,
+                text=text,
+                command=command,
+                **bulk_bttn_kwargs
+            ).grid(row=0, column=i + 1, padx=(2, 0))
 
-        self.list_frame = scrollable_frame.container
+        # Sidebar - List
+        self.sb_list = _VirtualList(
+            self.sidebar,
+            bg=colours['Grey'],
+            item_kwargs={
+                'bg': colours['Grey'],
+                'highlightthickness': 5,
+                'highlightbackground': colours['White']
+            },
+            on_toggle=self._sb_update_counter
+        )
+        self.sb_list.pack(padx=10, pady=(0, 10), fill=tk.BOTH, expand=True)
 
-        self.sb_cb_vars: list[tk.IntVar] = []
         self.sb_sel_counter = tk.StringVar(self, value='No Selection.')
 
         self._init_sidebar()
@@ -313,6 +965,7 @@ class BrowserApp(tk.Tk):
         self.sb_compare_bttn = _CustomButton(
             actions_container,
             text='Compare',
+            command=self._on_compare,
             **bttn_kwargs
         )
         self.sb_compare_bttn.grid(row=0, column=1, padx=2)
@@ -331,34 +984,289 @@ class BrowserApp(tk.Tk):
         )
         self.paned_window.add(self.container)
 
-    def _init_sidebar(self) -> None:
+        # If called from CLI
+        if project_path:
+            self.open_project(project_path=project_path)
+
+    def _init_sidebar(
+            self,
+            items: list[dict[str, Any]] | None = None,
+            search_index: _SearchIndex | None = None
+        ) -> None:
         """\
         Initialises sidebar contents.
+
+        Args
+        ----
+        items: list[dict[str, Any]] | None
+            The details of each model. Defaults to no models.
+
+        search_index: _SearchIndex | None
+            The search index for `items` - built if not given.
         """
-        self.sb_cb_vars = []  # Resets this list
+        items = items or []
 
-        for i in range(40):
-            item = _ListItem(
-                self.list_frame,
-                details={},
-                bg=colours['Grey'],
-                highlightthickness=5,
-                highlightbackground=colours['White']
-            )
-            item.pack(fill=tk.X)
+        self.sb_list.set_items(items)
+        self.sb_search_index = search_index or _SearchIndex(items=items)
 
-            item.cb_state.trace_add(
-                mode='write',
-                callback=self._sb_update_counter
-            )
-            self.sb_cb_vars.append(item.cb_state)
+        self.sb_search_query.set('')
+        self._sb_update_counter()
+
+    def _on_progress(self, fraction: float | None, message: str) -> None:
+        """\
+        Shows the progress of a background task in the status bar.
+        """
+        self.status_text.set(message)
+        self.status_cancel_bttn['state'] = tk.NORMAL
+
+        if fraction is None:
+            if str(self.status_progress['mode']) != 'indeterminate':
+                self.status_progress.config(mode='indeterminate')
+                self.status_progress.start()
+        else:
+            self.status_progress.stop()
+            self.status_progress.config(mode='determinate', value=fraction)
+
+    def _end_progress(self, message: str) -> None:
+        """\
+        Resets the status bar once a background task has ended.
+        """
+        self.status_progress.stop()
+        self.status_progress.config(mode='determinate', value=0.)
+        self.status_cancel_bttn['state'] = tk.DISABLED
+        self.status_text.set(message)
+
+    def _on_task_error(self, error: Exception) -> None:
+        """\
+        Reports a failed background task.
+        """
+        self._end_progress(message='Failed.')
+        messagebox.showerror(title='Labbook', message=str(error), parent=self)
+
+    def _on_load_error(self, error: Exception) -> None:
+        """\
+        Reports a project which failed to load.
+        """
+        self._load_task = None
+        self._on_task_error(error)
+
+    def _on_compare_error(self, error: Exception) -> None:
+        """\
+        Reports models which failed to be compared.
+        """
+        self._compare_task = None
+        self._on_task_error(error)
+
+    def _on_cancel(self) -> None:
+        """\
+        Cancels the running background tasks - the status bar is left as it
+        is if there are none.
+        """
+        if self._load_task is None and self._compare_task is None:
+            return
+
+        for task in (self._load_task, self._compare_task):
+            if task is not None:
+                self.tasks.cancel(task)
+
+        self._load_task = self._compare_task = None
+        self._end_progress(message='Cancelled.')
+
+    def _on_open(self) -> None:
+        """\
+        Asks for a project directory and opens it.
+        """
+        project_path = filedialog.askdirectory(
+            parent=self,
+            initialdir='./',
+            mustexist=True,
+            title='Open a Labbook Project'
+        )
+
+        if project_path:
+            self.open_project(project_path=project_path)
+
+    def open_project(self, project_path: str | pathlib.Path) -> None:
+        """\
+        Opens a project in the background.
+
+        Args
+        ----
+        project_path: str | pathlib.Path
+            The path to the project.
+        """
+        self._on_cancel()
+
+        self._load_task = self.tasks.submit(
+            _load_project,
+            pathlib.Path(project_path),
+            on_done=self._on_project_loaded,
+            on_progress=self._on_progress,
+            on_error=self._on_load_error
+        )
+
+    def _on_project_loaded(
+            self,
+            result: tuple[Labbook, list[dict[str, Any]], _SearchIndex]
+        ) -> None:
+        """\
+        Shows a project once it has been loaded.
+        """
+        self._load_task = None
+        self.labbook, items, search_index = result
+
+        self._init_sidebar(items=items, search_index=search_index)
+        self._clear_container()
+
+        self._end_progress(message=str(self.labbook))
+
+    def _on_close(self) -> None:
+        """\
+        Closes the open project.
+        """
+        self._on_cancel()
+
+        self.labbook = None
+
+        self._init_sidebar()
+        self._clear_container()
+
+        self._end_progress(message='No project open.')
+
+    def _on_compare(self) -> None:
+        """\
+        Compares the selected models in the background.
+        """
+        if self.labbook is None or not self.sb_list.selection.count:
+            return
+
+        if self._compare_task is not None:
+            self.tasks.cancel(self._compare_task)
+
+        names = [
+            self.sb_list.items[i]['Name']
+            for i in self.sb_list.selection.selected()
+        ]
+
+        self._compare_task = self.tasks.submit(
+            _compare_models,
+            self.labbook,
+            names,
+            on_done=self._on_compared,
+            on_progress=self._on_progress,
+            on_error=self._on_compare_error
+        )
+
+    def _on_compared(
+            self,
+            result: tuple[list[str], dict[str, list[str]]]
+        ) -> None:
+        """\
+        Shows the comparison table once the models have been compared.
+        """
+        self._compare_task = None
+        names, table = result
+
+        self._clear_container()
+
+        content = self.container.container
+
+        for i, name in enumerate([''] + names):
+            tk.Label(
+                content,
+                text=name,
+                font=fonts['Title'],
+                bg=colours['White'],
+                anchor=tk.W
+            ).grid(row=0, column=i, padx=10, pady=(10, 5), sticky=tk.W)
+
+        for row, (field, values) in enumerate(table.items(), start=1):
+            differs = len(set(values)) > 1
+
+            tk.Label(
+                content,
+                text=field,
+                font=fonts['Bold Text'],
+                bg=colours['White'],
+                anchor=tk.W
+            ).grid(row=row, column=0, padx=10, sticky=tk.W)
+
+            for column, value in enumerate(values, start=1):
+                tk.Label(
+                    content,
+                    text=value,
+                    font=fonts['Text'],
+                    bg=colours['White'],
+                    fg=colours['Blue'] if differs else 'black',
+                    anchor=tk.W,
+                    wraplength=250,
+                    justify=tk.LEFT
+                ).grid(row=row, column=column, padx=10, sticky=tk.W)
+
+        self._end_progress(message=f'Compared {len(names)} model(s).')
+
+    def _clear_container(self) -> None:
+        """\
+        Removes the contents of the main container.
+        """
+        for child in self.container.container.winfo_children():
+            child.destroy()
+
+    def _on_exit(self) -> None:
+        """\
+        Stops the background tasks and closes the window.
+        """
+        self.tasks.shutdown()
+        self.destroy()
 
     def _sb_update_counter(self, *_) -> None:
-        sel_num = sum(var.get() for var in self.sb_cb_vars)
+        sel_num = self.sb_list.selection.count
         self.sb_sel_counter.set(
             value=(f'{sel_num} Selected.' if sel_num else 'No Selection.')
         )
 
+    def _sb_view_indices(self) -> list[int] | None:
+        """\
+        Gets the indices of the items shown in the sidebar, or `None` if all
+        items are shown.
+        """
+        if len(self.sb_list.view) == len(self.sb_list.items):
+            return None
+
+        return self.sb_list.view
+
+    def _sb_select_all(self) -> None:
+        """\
+        Selects all the models shown in the sidebar.
+        """
+        self.sb_list.selection.select(self._sb_view_indices())
+        self.sb_list.refresh()
+        self._sb_update_counter()
+
+    def _sb_deselect_all(self) -> None:
+        """\
+        Deselects all the models shown in the sidebar.
+        """
+        self.sb_list.selection.deselect(self._sb_view_indices())
+        self.sb_list.refresh()
+        self._sb_update_counter()
+
+    def _sb_invert(self) -> None:
+        """\
+        Inverts the selection of the models shown in the sidebar.
+        """
+        self.sb_list.selection.invert(self._sb_view_indices())
+        self.sb_list.refresh()
+        self._sb_update_counter()
+
+    def _sb_filter(self, *_) -> None:
+        """\
+        Shows only the models which match the search query.
+        """
+        self.sb_list.set_view(
+            self.sb_search_index.search(self.sb_search_query.get())
+        )
+
 
 if __name__ == '__main__':
     app = BrowserApp()
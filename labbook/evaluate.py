@@ -0,0 +1,374 @@
+"""\
+Module contains the `Evaluator` class used to get the predictions of several
+saved models on HDF5 data in a single pass.
+"""
+__all__ = ['Evaluator']
+
+from typing import Any
+
+import os
+import pathlib
+import hashlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import h5py
+import joblib
+
+from labbook.labbook import Labbook
+
+PREDICTIONS_DIR = 'predictions'
+CHUNK_SIZE = 65_536
+HASH_BLOCK_SIZE = 1_048_576
+
+
+def _file_hash(path: pathlib.Path) -> str:
+    """\
+    Hashes the contents of a file.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the file.
+
+    Returns
+    -------
+    str
+        The SHA-256 hash of the file as a hex string.
+    """
+    digest = hashlib.sha256()
+
+    with open(file=path, mode='rb') as file:
+        while block := file.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def _dataset_hash(path: pathlib.Path, columns: list[str]) -> str:
+    """\
+    Hashes a selection of columns from a HDF5 file.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the HDF5 file.
+
+    columns : list[str]
+        The selected columns.
+
+    Returns
+    -------
+    str
+        The hash as a hex string.
+
+    Notes
+    -----
+        The hash uses the path, size, and modification time of the file rather
+        than its contents, so that checking the cache does not need a pass
+        over the data.
+    """
+    stat = path.stat()
+    key = [str(path.resolve()), stat.st_size, stat.st_mtime_ns, columns]
+
+    return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+
+
+def _save_predictions(path: pathlib.Path, predictions: np.ndarray) -> None:
+    """\
+    Atomically saves predictions to the cache.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the cached predictions (`.npy` file).
+
+    predictions : np.ndarray
+        The predictions.
+    """
+    path.parent.mkdir(exist_ok=True)
+
+    # Unique temporary file, so concurrent runs do not write to the same one
+    handle, temp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+
+    try:
+        with os.fdopen(handle, mode='wb') as file:
+            np.save(file, predictions)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _column_path(file: h5py.File, column: str) -> str:
+    """\
+    Gets the path to a column in a HDF5 file.
+
+    Parameters
+    ----------
+    file : h5py.File
+        The open HDF5 file.
+
+    column : str
+        The column name - either a HDF5 path (e.g. 'branch/var') or in the
+        'branch.var' format used by `high5`, where the branch name may itself
+        contain dots (e.g. 'rec.energy.numu.trkccE').
+
+    Returns
+    -------
+    str
+        The absolute HDF5 path to the column (e.g. '/branch/var'), so the 
+        different ways of naming a column give the same path.
+
+    Raises
+    ------
+    KeyError
+        If the column does not exist.
+    """
+    path = column if column in file else '/'.join(column.rsplit('.', 1))
+
+    if path not in file:
+        raise KeyError(f'No such column: \'{column}\'')
+
+    return file[path].name
+
+
+class Evaluator:
+    """\
+    Gets the predictions of saved models on data from a HDF5 file.
+
+    Notes
+    -----
+        The data is read in chunks and each chunk is passed to all the models
+        (in parallel) before the next chunk is read, so the file is only read
+        once however many models are evaluated.
+
+        Predictions are cached in the project, keyed by the hash of the saved
+        model and the hash of the data, so evaluating a model again on the
+        same data does not need the model or the data to be loaded.
+
+        The models are expected to be saved by `joblib` under the 'Model' key
+        of `Pickled` (as done by the `Scheduler`) and take the `XVars` columns
+        as a 2D array in order.
+    """
+
+    def __init__(
+            self,
+            labbook: Labbook,
+            n_jobs: int | None = None,
+            chunk_size: int = CHUNK_SIZE,
+            use_cache: bool = True
+        ) -> None:
+        """\
+        Initialise an `Evaluator` object.
+
+        Parameters
+        ----------
+        labbook : Labbook
+            The project containing the models.
+
+        n_jobs : int | None
+            The number of models which can predict at once. Defaults to the
+            number of CPUs.
+
+        chunk_size : int
+            The number of rows read from the file at once. Defaults to
+            `CHUNK_SIZE`.
+
+        use_cache : bool
+            Read and write cached predictions. Defaults to `True`.
+        """
+        self.labbook = labbook
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.use_cache = use_cache
+
+        self._model_hashes: dict[str, tuple[int, int, str]] = {}
+
+    def _artifact_path(self, name: str) -> pathlib.Path:
+        """\
+        [Internal] Gets the path to a saved model.
+
+        Raises
+        ------
+        ValueError
+            If the model was not saved as a file.
+        """
+        model = self.labbook.get_model(name)
+        artifact = model.Pickled.get('Model')
+
+        if not isinstance(artifact, str):
+            raise ValueError(f'Model \'{name}\' has no saved model file.')
+
+        return self.labbook.project_path / artifact
+
+    def _model_hash(self, name: str) -> str:
+        """\
+        [Internal] Hashes a saved model - re-used until the file changes.
+        """
+        path = self._artifact_path(name)
+        stat = path.stat()
+
+        cached = self._model_hashes.get(name)
+
+        if cached is None or cached[:2] != (stat.st_size, stat.st_mtime_ns):
+            cached = stat.st_size, stat.st_mtime_ns, _file_hash(path)
+            self._model_hashes[name] = cached
+
+        return cached[2]
+
+    def _cache_path(
+            self,
+            model_hash: str,
+            dataset_hash: str,
+            method: str
+        ) -> pathlib.Path:
+        """\
+        [Internal] Gets the path to the cached predictions.
+        """
+        return (
+            self.labbook.project_path / PREDICTIONS_DIR /
+            f'{model_hash[:16]}-{dataset_hash[:16]}-{method}.npy'
+        )
+
+    def predict(
+            self,
+            names: list[str],
+            file_path: str | pathlib.Path,
+            method: str = 'predict'
+        ) -> dict[str, np.ndarray]:
+        """\
+        Gets the predictions of several models on a HDF5 file.
+
+        Parameters
+        ----------
+        names : list[str]
+            The names of the models.
+
+        file_path : str | pathlib.Path
+            The path to the HDF5 file containing the `XVars` of the models.
+
+        method : str
+            The model method used to predict, e.g. 'predict_proba'. Defaults
+            to 'predict'.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The predictions of each model.
+
+        Raises
+        ------
+        KeyError
+            If a model or one of its `XVars` does not exist.
+
+        ValueError
+            If a model has no saved model file, or the columns do not have the
+            same length.
+        """
+        file_path = pathlib.Path(file_path)
+
+        with h5py.File(file_path, 'r') as file:
+            x_vars = {
+                name: [
+                    _column_path(file, column)
+                    for column in self.labbook.get_model(name).XVars
+                ]
+                for name in names
+            }
+
+        predictions: dict[str, np.ndarray] = {}
+        cache_paths: dict[str, pathlib.Path] = {}
+
+        # Hashing the models is only needed to look up the cache
+        for name in names if self.use_cache else []:
+            cache_path = self._cache_path(
+                model_hash=self._model_hash(name),
+                dataset_hash=_dataset_hash(file_path, x_vars[name]),
+                method=method
+            )
+
+            if cache_path.is_file():
+                predictions[name] = np.load(cache_path)
+            else:
+                cache_paths[name] = cache_path
+
+        missing = [name for name in names if name not in predictions]
+
+        if not missing:
+            return {name: predictions[name] for name in names}
+
+        results = self._stream(
+            {name: x_vars[name] for name in missing}, file_path, method
+        )
+
+        for name, result in results.items():
+            predictions[name] = result
+
+            if name in cache_paths:
+                _save_predictions(path=cache_paths[name], predictions=result)
+
+        return {name: predictions[name] for name in names}
+
+    def _stream(
+            self,
+            x_vars: dict[str, list[str]],
+            file_path: pathlib.Path,
+            method: str
+        ) -> dict[str, np.ndarray]:
+        """\
+        [Internal] Reads the file in chunks and passes each chunk to all the
+        models. `x_vars` maps the model names to the HDF5 paths of their 
+        columns.
+        """
+        names = list(x_vars.keys())
+        models: dict[str, Any] = {
+            name: joblib.load(self._artifact_path(name)) for name in names
+        }
+
+        # Each column is read once, even if used by several models
+        columns = list(dict.fromkeys(
+            column for name in names for column in x_vars[name]
+        ))
+
+        outputs: dict[str, list[np.ndarray]] = {name: [] for name in names}
+
+        with h5py.File(file_path, 'r') as file, \
+                ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            datasets = {column: file[column] for column in columns}
+            lengths = {len(dataset) for dataset in datasets.values()}
+
+            if len(lengths) > 1:
+                raise ValueError('Columns must have the same length.')
+
+            n_rows = lengths.pop() if lengths else 0
+
+            for start in range(0, n_rows, self.chunk_size):
+                stop = min(start + self.chunk_size, n_rows)
+
+                chunk = {
+                    column: dataset[start:stop].reshape(stop - start, -1)
+                    for column, dataset in datasets.items()
+                }
+
+                futures = {
+                    name: executor.submit(
+                        getattr(models[name], method),
+                        np.hstack([chunk[column] for column in x_vars[name]])
+                    )
+                    for name in names
+                }
+
+                for name, future in futures.items():
+                    outputs[name].append(np.asarray(future.result()))
+
+        return {
+            name: (
+                np.concatenate(output) if output else np.empty((0,))
+            )
+            for name, output in outputs.items()
+        }
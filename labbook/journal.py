@@ -0,0 +1,244 @@
+"""\
+Module contains the append-only journal used to record changes to a project
+without rewriting the `labbook.json` snapshot.
+"""
+__all__ = []
+
+from typing import Any
+from typing import Iterator
+
+import os
+import json
+import pathlib
+import contextlib
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+JOURNAL_FILE = 'labbook.journal'
+LOCK_FILE = 'labbook.lock'
+
+
+@contextlib.contextmanager
+def _file_lock(path: pathlib.Path, required: bool = True) -> Iterator[bool]:
+    """\
+    Holds an exclusive (blocking) lock on a file for the duration of the
+    context.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the lock file - created if it does not exist.
+
+    required : bool
+        Raise if the lock file cannot be opened for writing, rather than
+        continuing without the lock. Defaults to `True`.
+
+    Yields
+    ------
+    bool
+        Whether the lock is held.
+    """
+    try:
+        file = open(file=path, mode='a+b')
+    except OSError:  # E.g. read-only or shared project directories
+        if required:
+            raise
+
+        file = None
+
+    if file is None:
+        yield False
+        return
+
+    with file:
+        if os.name == 'nt':
+            file.seek(0)
+
+            while True:  # `LK_LOCK` gives up after ~10 seconds...
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+        try:
+            yield True
+        finally:
+            if os.name == 'nt':
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class _Journal:
+    """\
+    [Internal] Append-only journal of JSON records, one record per line.
+
+    The first line of the journal is a header record which stores the
+    generation of the snapshot the journal applies to. The generation is
+    incremented each time the journal is compacted into the snapshot, so
+    readers can tell if their view of the journal is out of date.
+    """
+
+    def __init__(self, project_path: pathlib.Path) -> None:
+        """\
+        Initialise a `_Journal` object.
+
+        Parameters
+        ----------
+        project_path : pathlib.Path
+            The path to the project.
+        """
+        self.path = project_path / JOURNAL_FILE
+        self.lock_path = project_path / LOCK_FILE
+
+    def lock(
+            self,
+            required: bool = True
+        ) -> contextlib.AbstractContextManager[bool]:
+        """\
+        Returns a context manager which holds the project lock. All reads and
+        writes to the journal or snapshot should be made while holding it.
+
+        Parameters
+        ----------
+        required : bool
+            Raise if the lock cannot be created, rather than continuing 
+            without it. Defaults to `True`.
+        """
+        return _file_lock(path=self.lock_path, required=required)
+
+    def size(self) -> int:
+        """\
+        Returns the size of the journal in bytes.
+        """
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def generation(self) -> int:
+        """\
+        Reads the generation from the journal header.
+
+        Returns
+        -------
+        int
+            The generation - zero if the journal does not exist yet.
+        """
+        try:
+            with open(file=self.path, mode='rb') as file:
+                header = file.readline()
+        except FileNotFoundError:
+            return 0
+
+        try:
+            return json.loads(header)['Generation']
+        except (ValueError, KeyError):
+            return 0
+
+    def read(self, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
+        """\
+        Reads the records in the journal, starting from a byte offset.
+
+        Parameters
+        ----------
+        offset : int
+            The byte offset to start reading from. Defaults to 0.
+
+        Returns
+        -------
+        tuple[list[dict[str, Any]], int]
+            The records (excluding the header) and the byte offset of the end
+            of the last complete record.
+
+        Notes
+        -----
+            Incomplete or unreadable lines (e.g. left by a worker which was
+            killed mid-write) are skipped.
+        """
+        records = []
+
+        try:
+            file = open(file=self.path, mode='rb')
+        except FileNotFoundError:
+            return records, offset
+
+        with file:
+            file.seek(offset)
+
+            for line in file:
+                if not line.endswith(b'\n'):
+                    break
+
+                offset += len(line)
+
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+
+                if 'Op' in record:
+                    records.append(record)
+
+        return records, offset
+
+    def append(self, record: dict[str, Any]) -> int:
+        """\
+        Appends a record to the end of the journal.
+
+        Parameters
+        ----------
+        record : dict[str, Any]
+            The record to append - must be JSON serialisable.
+
+        Returns
+        -------
+        int
+            The byte offset of the end of the journal after the write.
+        """
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+
+        with open(file=self.path, mode='ab') as file:
+            # Makes sure a torn line is not merged with the new record
+            if file.tell() > 0:
+                with open(file=self.path, mode='rb') as reader:
+                    reader.seek(-1, os.SEEK_END)
+
+                    if reader.read(1) != b'\n':
+                        file.write(b'\n')
+
+            file.write(line.encode('utf-8'))
+            file.flush()
+            os.fsync(file.fileno())
+
+            return file.tell()
+
+    def reset(self, generation: int) -> int:
+        """\
+        Truncates the journal and writes a new header.
+
+        Parameters
+        ----------
+        generation : int
+            The generation of the new snapshot.
+
+        Returns
+        -------
+        int
+            The byte offset of the end of the journal after the write.
+        """
+        header = json.dumps({'Generation': generation}) + '\n'
+
+        with open(file=self.path, mode='wb') as file:
+            file.write(header.encode('utf-8'))
+            file.flush()
+            os.fsync(file.fileno())
+
+            return file.tell()
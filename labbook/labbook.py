@@ -5,15 +5,23 @@ __all__ = ['Labbook']
 
 from typing import Any
 
+import os
 import pathlib
 from datetime import datetime
 from pydantic import BaseModel
+from pydantic import field_serializer
 from pydantic import field_validator
 import json
 
 import joblib
 
+from labbook.journal import _Journal
+
 DATE_FMT = '%d-%m-%Y %H:%M'
+SNAPSHOT_FILE = 'labbook.json'
+
+# Journal is compacted into the snapshot once it grows past this size
+AUTO_COMPACT_BYTES = 1_048_576
 
 
 def _process_dir(path: str | pathlib.Path) -> pathlib.Path:
@@ -57,16 +65,25 @@ class _Model(BaseModel):
     Transforms: list[str]
     Pickled: dict[str, Any]
     Flagged: bool = False
+    Tags: list[str] = []
 
     @field_validator('Time', mode='before')
-    def parse_time(cls, value: str) -> datetime:
+    def parse_time(cls, value: str | datetime) -> datetime:
+        if isinstance(value, datetime):
+            return value
+
         return datetime.strptime(value, DATE_FMT)
 
+    @field_serializer('Time')
+    def dump_time(self, value: datetime) -> str:
+        return value.strftime(DATE_FMT)
+
 
 class _Project(BaseModel):
     Name: str
     Comments: dict[str, str]  # Stores the time in key and comment in value
     Models: list[_Model]
+    Generation: int = 0  # Incremented each time the journal is compacted
     # Dir: pathlib.Path
 
 
@@ -88,12 +105,106 @@ def _open_project(project_path: pathlib.Path) -> _Project:
     _Project
         The project as a Pydantic `_Project` object.
     """
-    with open(file=project_path / 'labbook.json', mode='r') as file:
+    with open(file=project_path / SNAPSHOT_FILE, mode='r') as file:
         data = json.load(file)
 
     return _Project(**data)
 
 
+def _save_project(project_path: pathlib.Path, project: _Project) -> None:
+    """\
+    Atomically overwrites the saved project snapshot.
+
+    Parameters
+    ----------
+    project_path : pathlib.Path
+        The path to the project.
+
+    project : _Project
+        The project to save.
+    """
+    temp_path = project_path / (SNAPSHOT_FILE + '.tmp')
+
+    with open(file=temp_path, mode='w') as file:
+        json.dump(project.model_dump(mode='json'), file, indent=4)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(temp_path, project_path / SNAPSHOT_FILE)
+
+
+def _snapshot_id(project_path: pathlib.Path) -> tuple[int, int, int]:
+    """\
+    Identifies the current version of the saved project snapshot.
+
+    Parameters
+    ----------
+    project_path : pathlib.Path
+        The path to the project.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        The inode, size, and modification time of the snapshot - the inode
+        changes each time the snapshot is replaced by `_save_project`.
+    """
+    stat = (project_path / SNAPSHOT_FILE).stat()
+
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _apply_record(
+        project: _Project,
+        index: dict[str, int],
+        record: dict[str, Any]
+    ) -> None:
+    """\
+    Applies a journal record to a project.
+
+    Parameters
+    ----------
+    project : _Project
+        The project to modify (in place).
+
+    index : dict[str, int]
+        Maps the model names to their position in `project.Models` - updated
+        in place.
+
+    record : dict[str, Any]
+        The journal record.
+
+    Raises
+    ------
+    ValueError
+        If the record operation is not recognised.
+    """
+    match record['Op']:
+        case 'AddModel':
+            model = _Model(**record['Model'])
+
+            if model.Name in index:
+                return
+
+            index[model.Name] = len(project.Models)
+            project.Models.append(model)
+
+        case 'AddComment':
+            time, comment = record['Time'], record['Comment']
+
+            if time in project.Comments:
+                comment = project.Comments[time] + '\n' + comment
+
+            project.Comments[time] = comment
+
+        case 'FlagModel':
+            if record['Name'] in index:
+                model = project.Models[index[record['Name']]]
+                model.Flagged = record['Flagged']
+
+        case _:
+            raise ValueError(f'Unknown journal operation \'{record["Op"]}\'.')
+
+
 class Labbook:
     """\
     Manages a machine learning project.
@@ -102,14 +213,295 @@ class Labbook:
     -----
         This version of `Labbook` is compatible with: TensorFlow, and Sci-Kit 
         Learn projects.
+
+        Changes to the project are appended to a journal (`labbook.journal`)
+        next to the snapshot (`labbook.json`) while holding a file lock, so 
+        several processes can safely write to the same project. The journal 
+        is merged into the snapshot by `compact`, which is also called
+        automatically once the journal grows too large.
     """
 
-    def __init__(self, project_path: str | pathlib.Path) -> None:
+    def __init__(
+            self,
+            project_path: str | pathlib.Path,
+            auto_compact: bool = True
+        ) -> None:
         """\
         Initialise a `Labbook` object and open a project.
+
+        Parameters
+        ----------
+        project_path : str | pathlib.Path
+            The path to the project.
+
+        auto_compact : bool
+            Compact the journal when it grows past `AUTO_COMPACT_BYTES`. 
+            Defaults to `True`.
         """
         self._project_path = _process_dir(path=project_path)
+        self._journal = _Journal(project_path=self._project_path)
+        self._auto_compact = auto_compact
+
+        self.reload()
+
+    def _replay(self, recover: bool = True) -> None:
+        """\
+        [Internal] Reads the snapshot and replays the journal on top of it - 
+        must be called while holding the project lock, unless `recover` is 
+        `False`.
+
+        Parameters
+        ----------
+        recover : bool
+            Reset a journal left by an interrupted compaction. Defaults to
+            `True`.
+        """
+        self._snapshot = _snapshot_id(project_path=self._project_path)
         self._project = _open_project(project_path=self._project_path)
+        self._index = {
+            model.Name: i for i, model in enumerate(self._project.Models)
+        }
+        self._generation = self._journal.generation()
+
+        if self._generation < self._project.Generation:
+            # Compaction was interrupted after the snapshot was written, so 
+            # the journal records are already in the snapshot
+            self._generation = self._project.Generation
+
+            if recover:
+                self._offset = self._journal.reset(generation=self._generation)
+            else:
+                self._offset = self._journal.size()
+
+            return
+
+        records, self._offset = self._journal.read()
+
+        for record in records:
+            _apply_record(self._project, self._index, record)
+
+    def _catch_up(self) -> None:
+        """\
+        [Internal] Applies records written by other processes since the last
+        read - must be called while holding the project lock.
+        """
+        # The snapshot is also checked, as a compaction by someone else may
+        # have been interrupted before the journal was reset
+        if (
+                self._journal.generation() != self._generation
+                or _snapshot_id(project_path=self._project_path)
+                != self._snapshot
+            ):
+            self._replay()
+            return
+
+        records, self._offset = self._journal.read(offset=self._offset)
+
+        for record in records:
+            _apply_record(self._project, self._index, record)
+
+    def _write(self, record: dict[str, Any]) -> None:
+        """\
+        [Internal] Appends a record to the journal and applies it.
+        """
+        with self._journal.lock():
+            self._catch_up()
+            self._check_record(record)
+
+            self._offset = self._journal.append(record)
+            _apply_record(self._project, self._index, record)
+
+            if self._auto_compact and self._offset > AUTO_COMPACT_BYTES:
+                self._compact()
+
+    def _check_record(self, record: dict[str, Any]) -> None:
+        """\
+        [Internal] Checks that a record can be applied to the current project.
+
+        Raises
+        ------
+        ValueError
+            If a model is added twice.
+
+        KeyError
+            If the record refers to a model which does not exist.
+        """
+        if record['Op'] == 'AddModel':
+            name = record['Model']['Name']
+
+            if name in self._index:
+                raise ValueError(f'Model \'{name}\' already exists.')
+
+        if record['Op'] == 'FlagModel' and record['Name'] not in self._index:
+            raise KeyError(f'No such model: \'{record["Name"]}\'')
+
+    def _compact(self) -> None:
+        """\
+        [Internal] Writes the project snapshot and resets the journal - must 
+        be called while holding the project lock.
+        """
+        self._project.Generation = self._generation + 1
+        _save_project(project_path=self._project_path, project=self._project)
+
+        self._snapshot = _snapshot_id(project_path=self._project_path)
+        self._generation = self._project.Generation
+        self._offset = self._journal.reset(generation=self._generation)
+
+    def reload(self) -> None:
+        """\
+        Re-reads the project from disk, including changes made by other 
+        processes.
+
+        Notes
+        -----
+            If the project lock cannot be created (e.g. the project directory
+            is read-only), the project is read without the lock and is not
+            repaired after an interrupted compaction.
+        """
+        with self._journal.lock(required=False) as locked:
+            self._replay(recover=locked)
+
+    def compact(self) -> None:
+        """\
+        Merges the journal into the project snapshot.
+        """
+        with self._journal.lock():
+            self._catch_up()
+            self._compact()
+
+    @property
+    def project_path(self) -> pathlib.Path:
+        """\
+        The path to the project.
+        """
+        return self._project_path
+
+    @property
+    def models(self) -> list[_Model]:
+        """\
+        The trained models saved in the project.
+        """
+        return self._project.Models
+
+    def get_model(self, name: str) -> _Model:
+        """\
+        Gets a saved model by name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the model.
+
+        Returns
+        -------
+        _Model
+            The model information.
+
+        Raises
+        ------
+        KeyError
+            If the model does not exist.
+        """
+        if name not in self._index:
+            raise KeyError(f'No such model: \'{name}\'')
+
+        return self._project.Models[self._index[name]]
+
+    def add_model(
+            self,
+            name: str,
+            trained_on: list[str],
+            x_vars: list[str],
+            y_vars: list[str],
+            transforms: list[str],
+            pickled: dict[str, Any],
+            comments: str = '',
+            tags: list[str] | None = None,
+            time: datetime | None = None
+        ) -> None:
+        """\
+        Records a new trained model in the project.
+
+        Parameters
+        ----------
+        name : str
+            The (unique) name of the model.
+
+        trained_on : list[str]
+            The datasets used to train the model.
+
+        x_vars : list[str]
+            The input variables.
+
+        y_vars : list[str]
+            The output variables.
+
+        transforms : list[str]
+            The transforms applied to the data before training.
+
+        pickled : dict[str, Any]
+            The saved model artifacts - must be JSON serialisable.
+
+        comments : str
+            Comments about the model. Defaults to ''.
+
+        tags : list[str] | None
+            Tags used to search for the model. Defaults to no tags.
+
+        time : datetime | None
+            The time the model was trained. Defaults to now.
+
+        Raises
+        ------
+        ValueError
+            If a model with the same name already exists.
+        """
+        model = _Model(
+            Name=name,
+            Time=time or datetime.now(),
+            Comments=comments,
+            TrainedOn=trained_on,
+            XVars=x_vars,
+            YVars=y_vars,
+            Transforms=transforms,
+            Pickled=pickled,
+            Tags=tags or []
+        )
+        self._write({'Op': 'AddModel', 'Model': model.model_dump(mode='json')})
+
+    def add_comment(self, comment: str, time: datetime | None = None) -> None:
+        """\
+        Adds a comment to the project.
+
+        Parameters
+        ----------
+        comment : str
+            The comment.
+
+        time : datetime | None
+            The time of the comment. Defaults to now.
+        """
+        time = (time or datetime.now()).strftime(DATE_FMT)
+        self._write({'Op': 'AddComment', 'Time': time, 'Comment': comment})
+
+    def flag_model(self, name: str, flagged: bool = True) -> None:
+        """\
+        Flags (or un-flags) a saved model.
+
+        Parameters
+        ----------
+        name : str
+            The name of the model.
+
+        flagged : bool
+            Whether the model is flagged. Defaults to `True`.
+
+        Raises
+        ------
+        KeyError
+            If the model does not exist.
+        """
+        self._write({'Op': 'FlagModel', 'Name': name, 'Flagged': flagged})
 
     # @classmethod
     # def create_new_project(
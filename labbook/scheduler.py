@@ -0,0 +1,462 @@
+"""\
+Module contains the `Scheduler` class used to train and save several models
+in parallel.
+"""
+__all__ = ['Scheduler', 'ModelSpec', 'JobResult']
+
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+import os
+import json
+import time
+import contextlib
+import pathlib
+import warnings
+import itertools
+import traceback
+from collections import deque
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from multiprocessing.connection import wait
+from pydantic import BaseModel
+
+import joblib
+
+from labbook.labbook import Labbook
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+MODELS_DIR = 'models'
+
+# Environment variables used by common numerical libraries to size their
+# thread pools
+THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'TF_NUM_INTRAOP_THREADS'
+)
+
+
+class ModelSpec(BaseModel):
+    """\
+    Specification for a model to be trained by the `Scheduler`.
+    """
+    Name: str
+    Params: dict[str, Any] = {}
+    TrainedOn: list[str] = []
+    XVars: list[str] = []
+    YVars: list[str] = []
+    Transforms: list[str] = []
+    Comments: str = ''
+    Tags: list[str] = []
+
+
+class JobResult(BaseModel):
+    """\
+    Outcome of a training job run by the `Scheduler`.
+    """
+    Name: str
+    Success: bool
+    Attempts: int
+    Duration: float
+    Error: str = ''
+
+
+@contextlib.contextmanager
+def _thread_env(threads_per_job: int | None) -> Iterator[None]:
+    """\
+    Sets the thread pool environment variables for the duration of the 
+    context, so they are inherited by worker processes started inside it.
+
+    Parameters
+    ----------
+    threads_per_job : int | None
+        The number of threads numerical libraries are allowed to use - the
+        environment is left unchanged if `None`.
+    """
+    if threads_per_job is None:
+        yield
+        return
+
+    old_env = {var: os.environ.get(var) for var in THREAD_ENV_VARS}
+
+    try:
+        for var in THREAD_ENV_VARS:
+            os.environ[var] = str(threads_per_job)
+
+        yield
+    finally:
+        for var, value in old_env.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def _set_limits(
+        cpu_time_limit: int | None,
+        memory_limit: int | None
+    ) -> None:
+    """\
+    Applies resource limits to the current (worker) process.
+
+    Parameters
+    ----------
+    cpu_time_limit : int | None
+        The maximum CPU time in seconds.
+
+    memory_limit : int | None
+        The maximum address space in bytes.
+    """
+    if resource is None:
+        return
+
+    if cpu_time_limit is not None:
+        resource.setrlimit(
+            resource.RLIMIT_CPU, (cpu_time_limit, cpu_time_limit + 1)
+        )
+
+    if memory_limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def _run_job(
+        conn: Connection,
+        train: Callable[..., Any],
+        spec: ModelSpec,
+        save_path: pathlib.Path,
+        limits: tuple[int | None, int | None, int | None]
+    ) -> None:
+    """\
+    Trains and saves a single model - runs in a worker process.
+
+    Parameters
+    ----------
+    conn : Connection
+        Pipe used to send the outcome (`None` or the error traceback) back to
+        the scheduler.
+
+    train : Callable[..., Any]
+        The user provided training function.
+
+    spec : ModelSpec
+        The model specification.
+
+    save_path : pathlib.Path
+        The path to save the trained model to.
+
+    limits : tuple[int | None, int | None, int | None]
+        The CPU time, memory, and thread limits.
+    """
+    cpu_time_limit, memory_limit, threads_per_job = limits
+
+    try:
+        _set_limits(cpu_time_limit=cpu_time_limit, memory_limit=memory_limit)
+
+        # Libraries loaded before the worker started (e.g. inherited on 
+        # 'fork') do not read the environment variables again
+        if threads_per_job is not None and threadpool_limits is not None:
+            thread_limits = threadpool_limits(limits=threads_per_job)
+        else:
+            thread_limits = contextlib.nullcontext()
+
+        with thread_limits:
+            model = train(**spec.Params)
+
+        joblib.dump(model, save_path)
+
+        conn.send(None)
+    except BaseException:  # Includes `MemoryError` and `SystemExit`
+        conn.send(traceback.format_exc())
+    finally:
+        conn.close()
+
+
+class Scheduler:
+    """\
+    Trains several models in parallel on a local process pool and saves them
+    into a `Labbook` project.
+
+    Notes
+    -----
+        Each job runs in a fresh process, so per-job limits are applied
+        independently and a crashed job (e.g. one killed for exceeding its
+        limits) does not affect the other jobs. The training function may 
+        start its own processes (e.g. a PyTorch `DataLoader` with workers).
+
+        The training function is called with the `Params` of each model spec
+        as keyword arguments and must return the trained model. It must be
+        picklable (i.e. defined at the top level of a module) when the 'spawn'
+        start method is used, e.g. on Windows.
+
+        The model specs are recorded in the project, so their `Params` must be
+        JSON serialisable.
+
+        CPU time and memory limits use the `resource` module and are ignored
+        on platforms where it is not available.
+
+        The thread limit is set with environment variables when each worker 
+        is started and, if `threadpoolctl` is installed, applied again inside 
+        the worker for libraries which were already loaded.
+    """
+
+    def __init__(
+            self,
+            labbook: Labbook,
+            train: Callable[..., Any],
+            n_jobs: int | None = None,
+            max_retries: int = 1,
+            cpu_time_limit: int | None = None,
+            memory_limit: int | None = None,
+            threads_per_job: int | None = None
+        ) -> None:
+        """\
+        Initialise a `Scheduler` object.
+
+        Parameters
+        ----------
+        labbook : Labbook
+            The project to save the trained models into.
+
+        train : Callable[..., Any]
+            The training function - returns a trained model.
+
+        n_jobs : int | None
+            The number of jobs to run at once. Defaults to the number of CPUs.
+
+        max_retries : int
+            The number of times a failed job is retried. Defaults to 1.
+
+        cpu_time_limit : int | None
+            The CPU time limit per job in seconds. Defaults to no limit.
+
+        memory_limit : int | None
+            The memory limit per job in bytes. Defaults to no limit.
+
+        threads_per_job : int | None
+            The number of threads numerical libraries may use in each job.
+            Defaults to the library defaults.
+        """
+        self.labbook = labbook
+        self.train = train
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.max_retries = max_retries
+        self.limits = cpu_time_limit, memory_limit, threads_per_job
+
+        if resource is None and (cpu_time_limit or memory_limit):
+            warnings.warn(
+                'CPU time and memory limits are not supported on this '
+                'platform and will be ignored.'
+            )
+
+    @staticmethod
+    def grid(
+            name: str,
+            param_grid: dict[str, list[Any]],
+            **spec_kwargs
+        ) -> list[ModelSpec]:
+        """\
+        Creates model specs for every combination of parameters in a grid.
+
+        Parameters
+        ----------
+        name : str
+            The model name - formatted with the parameters of each model, e.g.
+            'MLP-{layers}-{lr}'. The index of the combination is appended if
+            the name has no fields.
+
+        param_grid : dict[str, list[Any]]
+            Maps the parameter names to the values to try.
+
+        **spec_kwargs
+            Other `ModelSpec` fields shared by all the models.
+
+        Returns
+        -------
+        list[ModelSpec]
+            The model specs.
+        """
+        keys = list(param_grid.keys())
+        specs = []
+
+        for i, values in enumerate(itertools.product(*param_grid.values())):
+            params = dict(zip(keys, values))
+            model_name = name.format(**params)
+
+            if model_name == name:
+                model_name = f'{name}-{i}'
+
+            specs.append(
+                ModelSpec(Name=model_name, Params=params, **spec_kwargs)
+            )
+
+        return specs
+
+    def _record(self, spec: ModelSpec) -> str | None:
+        """\
+        [Internal] Records a trained model in the project.
+
+        Returns
+        -------
+        str | None
+            The error traceback if the model could not be recorded (e.g. a
+            model with the same name was added by another process).
+        """
+        try:
+            self.labbook.add_model(
+                name=spec.Name,
+                trained_on=spec.TrainedOn,
+                x_vars=spec.XVars,
+                y_vars=spec.YVars,
+                transforms=spec.Transforms,
+                pickled={
+                    'Model': f'{MODELS_DIR}/{spec.Name}.joblib',
+                    'Params': spec.Params
+                },
+                comments=spec.Comments,
+                tags=spec.Tags
+            )
+        except Exception:
+            return traceback.format_exc()
+
+        return None
+
+    def run(self, specs: list[ModelSpec]) -> list[JobResult]:
+        """\
+        Trains the models and saves the successful ones into the project.
+
+        Parameters
+        ----------
+        specs : list[ModelSpec]
+            The models to train.
+
+        Returns
+        -------
+        list[JobResult]
+            The outcome of each job, in the same order as `specs`.
+
+        Raises
+        ------
+        ValueError
+            If a model name is repeated, already exists in the project, or 
+            cannot be used as a file name, or if the `Params` of a model are
+            not JSON serialisable.
+        """
+        names = [spec.Name for spec in specs]
+
+        if len(set(names)) != len(names):
+            raise ValueError('Model names must be unique.')
+
+        for name in names:
+            if name in ('', '.', '..') or any(c in name for c in '/\\:\0'):
+                raise ValueError(
+                    f'Model name \'{name}\' cannot be used as a file name.'
+                )
+
+        for name in names:
+            try:
+                self.labbook.get_model(name)
+            except KeyError:
+                continue
+
+            raise ValueError(f'Model \'{name}\' already exists.')
+
+        for spec in specs:
+            try:
+                json.dumps(spec.Params)
+            except (TypeError, ValueError) as error:
+                raise ValueError(
+                    f'Params of model \'{spec.Name}\' must be JSON '
+                    f'serialisable: {error}'
+                ) from error
+
+        models_dir = self.labbook.project_path / MODELS_DIR
+        models_dir.mkdir(exist_ok=True)
+
+        results: dict[str, JobResult] = {}
+        attempts = {name: 0 for name in names}
+        pending = deque(specs)
+        running: dict[
+            Connection, tuple[ModelSpec, mp.Process, float]
+        ] = {}
+
+        try:
+            while pending or running:
+                while pending and len(running) < self.n_jobs:
+                    spec = pending.popleft()
+                    attempts[spec.Name] += 1
+
+                    recv_conn, send_conn = mp.Pipe(duplex=False)
+                    process = mp.Process(
+                        target=_run_job,
+                        args=(
+                            send_conn,
+                            self.train,
+                            spec,
+                            models_dir / f'{spec.Name}.joblib',
+                            self.limits
+                        )
+                    )
+
+                    with _thread_env(threads_per_job=self.limits[2]):
+                        process.start()
+
+                    send_conn.close()
+
+                    running[recv_conn] = spec, process, time.perf_counter()
+
+                # Waits on the pipes rather than the processes, so a worker is
+                # never blocked sending a large traceback - the pipe is closed
+                # (EOF) when a worker exits or is killed
+                for recv_conn in wait(list(running.keys())):
+                    spec, process, start = running.pop(recv_conn)
+
+                    try:
+                        error = recv_conn.recv()
+                        reported = True
+                    except EOFError:  # Worker was killed before reporting back
+                        reported = False
+                    finally:
+                        recv_conn.close()
+
+                    process.join()
+
+                    if not reported:
+                        error = f'Worker exited with code {process.exitcode}.'
+
+                    retry = attempts[spec.Name] <= self.max_retries
+
+                    if error is not None and retry:
+                        pending.append(spec)
+                        continue
+
+                    if error is None:
+                        error = self._record(spec)
+
+                    results[spec.Name] = JobResult(
+                        Name=spec.Name,
+                        Success=error is None,
+                        Attempts=attempts[spec.Name],
+                        Duration=time.perf_counter() - start,
+                        Error=error or ''
+                    )
+        finally:
+            # Workers are not daemonic, so that training functions can start
+            # their own processes - they are stopped here if the run fails
+            for recv_conn, (_, process, _) in running.items():
+                recv_conn.close()
+                process.terminate()
+                process.join()
+
+        return [results[name] for name in names]
@@ -0,0 +1,254 @@
+"""\
+Module contains helpers for running slow work (e.g. loading projects) away
+from the Tkinter thread.
+"""
+__all__ = ['TaskCancelled']
+
+from typing import Any
+from typing import Callable
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import tkinter as tk
+
+POLL_INTERVAL = 50  # ms
+
+
+class TaskCancelled(Exception):
+    """\
+    Raised inside a task when it has been cancelled.
+    """
+
+
+class _TaskContext:
+    """\
+    [Internal] Passed to a running task to report progress and check for
+    cancellation.
+    """
+
+    def __init__(self, runner: '_TaskRunner', task_id: int) -> None:
+        """\
+        Initialise a `_TaskContext` object.
+        """
+        self._runner = runner
+        self.task_id = task_id
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """\
+        Whether the task has been cancelled.
+        """
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """\
+        Requests the task to stop.
+        """
+        self._cancel_event.set()
+
+    def check(self) -> None:
+        """\
+        Stops the task if it has been cancelled.
+
+        Raises
+        ------
+        TaskCancelled
+            If the task has been cancelled.
+        """
+        if self.cancelled:
+            raise TaskCancelled()
+
+    def progress(self, fraction: float | None, message: str = '') -> None:
+        """\
+        Reports the progress of the task and stops it if it has been
+        cancelled.
+
+        Parameters
+        ----------
+        fraction : float | None
+            The fraction of the task completed, or `None` if unknown.
+
+        message : str
+            A short description of the current step. Defaults to ''.
+
+        Raises
+        ------
+        TaskCancelled
+            If the task has been cancelled.
+        """
+        self.check()
+        self._runner._post(self.task_id, 'progress', (fraction, message))
+
+
+class _TaskRunner:
+    """\
+    [Internal] Runs tasks on a background thread pool and calls the task
+    callbacks on the Tkinter thread.
+
+    Notes
+    -----
+        Tkinter is not thread safe, so the worker threads never touch the
+        widgets. Instead, the results are put in a queue which is emptied on
+        the Tkinter thread using `after`.
+    """
+
+    def __init__(self, root: tk.Misc, max_workers: int = 2) -> None:
+        """\
+        Initialise a `_TaskRunner` object.
+
+        Parameters
+        ----------
+        root : tk.Misc
+            Any widget of the application - used to schedule the callbacks.
+
+        max_workers : int
+            The number of tasks which can run at once. Defaults to 2.
+        """
+        self._root = root
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='labbook-task'
+        )
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._callbacks: dict[int, dict[str, Callable[..., Any]]] = {}
+        self._contexts: dict[int, _TaskContext] = {}
+        self._next_id = 0
+
+        self._poll()
+
+    def _post(self, task_id: int, event: str, value: Any) -> None:
+        """\
+        [Internal] Sends an event from a worker thread to the Tkinter thread.
+        """
+        self._queue.put((task_id, event, value))
+
+    def _poll(self) -> None:
+        """\
+        [Internal] Calls the callbacks for the events posted by the tasks.
+
+        Notes
+        -----
+            The next poll is scheduled first, so a callback which raises does
+            not stop the callbacks of later tasks from being called.
+        """
+        self._root.after(POLL_INTERVAL, self._poll)
+
+        while True:
+            try:
+                task_id, event, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            callbacks = self._callbacks.get(task_id)
+
+            if callbacks is None:  # Task was cancelled or has finished
+                continue
+
+            if event != 'progress':
+                del self._callbacks[task_id]
+                del self._contexts[task_id]
+
+            if event == 'progress':
+                callbacks['on_progress'](*value)
+            elif event == 'done':
+                callbacks['on_done'](value)
+            elif event == 'error':
+                callbacks['on_error'](value)
+
+    def _run(
+            self,
+            context: _TaskContext,
+            func: Callable[..., Any],
+            args: tuple[Any, ...]
+        ) -> None:
+        """\
+        [Internal] Runs a task on a worker thread.
+        """
+        if context.cancelled:
+            return
+
+        try:
+            result = func(context, *args)
+        except TaskCancelled:
+            return
+        except Exception as error:
+            self._post(context.task_id, 'error', error)
+            return
+
+        self._post(context.task_id, 'done', result)
+
+    def submit(
+            self,
+            func: Callable[..., Any],
+            *args,
+            on_done: Callable[[Any], None] = lambda _: None,
+            on_progress: Callable[[float | None, str], None] = (
+                lambda *_: None
+            ),
+            on_error: Callable[[Exception], None] = lambda _: None
+        ) -> _TaskContext:
+        """\
+        Runs a task in the background.
+
+        Parameters
+        ----------
+        func : Callable[..., Any]
+            The task - called with a `_TaskContext` followed by `args`.
+
+        *args
+            Arguments for the task.
+
+        on_done : Callable[[Any], None]
+            Called with the result of the task.
+
+        on_progress : Callable[[float | None, str], None]
+            Called with the progress reported by the task.
+
+        on_error : Callable[[Exception], None]
+            Called with the exception if the task fails.
+
+        Returns
+        -------
+        _TaskContext
+            Used to cancel the task.
+
+        Notes
+        -----
+            None of the callbacks are called once the task is cancelled.
+        """
+        task_id = self._next_id
+        self._next_id += 1
+
+        context = _TaskContext(runner=self, task_id=task_id)
+
+        self._contexts[task_id] = context
+        self._callbacks[task_id] = {
+            'on_done': on_done,
+            'on_progress': on_progress,
+            'on_error': on_error
+        }
+
+        self._executor.submit(self._run, context, func, args)
+
+        return context
+
+    def cancel(self, context: _TaskContext) -> None:
+        """\
+        Cancels a task - its callbacks will not be called.
+        """
+        context.cancel()
+
+        self._callbacks.pop(context.task_id, None)
+        self._contexts.pop(context.task_id, None)
+
+    def shutdown(self) -> None:
+        """\
+        Cancels all the tasks and stops the worker threads.
+        """
+        for context in list(self._contexts.values()):
+            self.cancel(context)
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
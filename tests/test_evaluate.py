@@ -0,0 +1,38 @@
+"""\
+Tests for the `Evaluator` helpers.
+"""
+import pathlib
+
+import h5py
+import numpy as np
+import pytest
+
+from labbook.evaluate import _column_path
+
+
+@pytest.mark.parametrize(
+    'column, expected',
+    [
+        ('rec.a', '/rec/a'),
+        ('rec/a', '/rec/a'),
+        ('/rec/a', '/rec/a'),
+        ('rec.energy.numu.trkccE', '/rec.energy.numu/trkccE'),
+        ('rec.energy.numu/trkccE', '/rec.energy.numu/trkccE')
+    ]
+)
+def test_column_path(
+        tmp_path: pathlib.Path,
+        column: str,
+        expected: str
+    ) -> None:
+    file_path = tmp_path / 'data.h5'
+
+    with h5py.File(file_path, 'w') as file:
+        file['rec/a'] = np.arange(3)
+        file['rec.energy.numu/trkccE'] = np.arange(3)
+
+    with h5py.File(file_path, 'r') as file:
+        assert _column_path(file, column) == expected
+
+        with pytest.raises(KeyError):
+            _column_path(file, 'rec.missing')
@@ -0,0 +1,165 @@
+"""\
+Tests for the `Labbook` journal, locking, and compaction.
+"""
+import json
+import pathlib
+import multiprocessing as mp
+
+import pytest
+
+from labbook import journal
+from labbook.journal import JOURNAL_FILE
+from labbook.journal import _Journal
+from labbook.labbook import SNAPSHOT_FILE
+from labbook.labbook import Labbook
+
+
+@pytest.fixture
+def project_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    with open(file=tmp_path / SNAPSHOT_FILE, mode='w') as file:
+        json.dump({'Name': 'Test', 'Comments': {}, 'Models': []}, file)
+
+    return tmp_path
+
+
+def _add_model(labbook: Labbook, name: str) -> None:
+    labbook.add_model(
+        name=name,
+        trained_on=['train.h5'],
+        x_vars=['rec.a'],
+        y_vars=['rec.b'],
+        transforms=[],
+        pickled={}
+    )
+
+
+def _names(labbook: Labbook) -> list[str]:
+    return [model.Name for model in labbook.models]
+
+
+def _interrupt_compaction(labbook: Labbook) -> None:
+    """\
+    Compacts the project but fails before the journal is reset, as if the
+    process was killed after the snapshot was written.
+    """
+    def reset(generation: int) -> int:
+        raise KeyboardInterrupt()
+
+    labbook._journal.reset = reset
+
+    with pytest.raises(KeyboardInterrupt):
+        labbook.compact()
+
+
+def _writer(project_path: pathlib.Path, worker: int, n_models: int) -> None:
+    labbook = Labbook(project_path=project_path, auto_compact=False)
+
+    for i in range(n_models):
+        _add_model(labbook, name=f'Model-{worker}-{i}')
+        labbook.add_comment(comment=f'{worker}-{i}')
+
+        if i == n_models // 2:
+            labbook.compact()
+
+
+def test_replay_after_reopen(project_path: pathlib.Path) -> None:
+    labbook = Labbook(project_path=project_path)
+    _add_model(labbook, name='A')
+    labbook.flag_model(name='A')
+
+    reopened = Labbook(project_path=project_path)
+
+    assert _names(reopened) == ['A']
+    assert reopened.get_model('A').Flagged
+
+
+def test_concurrent_writers(project_path: pathlib.Path) -> None:
+    n_workers, n_models = 4, 20
+
+    workers = [
+        mp.Process(target=_writer, args=(project_path, worker, n_models))
+        for worker in range(n_workers)
+    ]
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0
+
+    labbook = Labbook(project_path=project_path)
+    comments = '\n'.join(labbook._project.Comments.values()).split('\n')
+
+    assert sorted(_names(labbook)) == sorted(
+        f'Model-{worker}-{i}'
+        for worker in range(n_workers) for i in range(n_models)
+    )
+    assert len(comments) == n_workers * n_models
+
+
+def test_torn_lines_are_skipped(project_path: pathlib.Path) -> None:
+    labbook = Labbook(project_path=project_path)
+    _add_model(labbook, name='A')
+
+    # A writer killed mid-write, and a line which is not valid JSON
+    with open(file=project_path / JOURNAL_FILE, mode='ab') as file:
+        file.write(b'not json\n{"Op": "AddModel", "Mod')
+
+    assert _names(Labbook(project_path=project_path)) == ['A']
+
+    _add_model(labbook, name='B')
+
+    assert _names(Labbook(project_path=project_path)) == ['A', 'B']
+
+    records, _ = _Journal(project_path=project_path).read()
+
+    assert [record['Model']['Name'] for record in records] == ['A', 'B']
+
+
+def test_interrupted_compaction(project_path: pathlib.Path) -> None:
+    labbook = Labbook(project_path=project_path)
+    _add_model(labbook, name='A')
+    labbook.add_comment(comment='Hello')
+
+    _interrupt_compaction(labbook)
+
+    reopened = Labbook(project_path=project_path)
+
+    assert _names(reopened) == ['A']
+    assert list(reopened._project.Comments.values()) == ['Hello']
+
+
+def test_interrupted_compaction_with_live_writer(
+        project_path: pathlib.Path
+    ) -> None:
+    writer = Labbook(project_path=project_path)
+    compactor = Labbook(project_path=project_path)
+
+    _add_model(writer, name='A')
+    _interrupt_compaction(compactor)
+    _add_model(writer, name='B')
+
+    assert _names(Labbook(project_path=project_path)) == ['A', 'B']
+
+
+def test_open_without_lock(
+        project_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+    labbook = Labbook(project_path=project_path)
+    _add_model(labbook, name='A')
+    _interrupt_compaction(labbook)
+
+    journal_data = (project_path / JOURNAL_FILE).read_bytes()
+
+    # The lock file cannot be created, as for a read-only directory
+    monkeypatch.setattr(journal, 'LOCK_FILE', 'missing/labbook.lock')
+
+    read_only = Labbook(project_path=project_path)
+
+    assert _names(read_only) == ['A']
+    assert (project_path / JOURNAL_FILE).read_bytes() == journal_data
+
+    with pytest.raises(OSError):
+        _add_model(read_only, name='B')